@@ -3,7 +3,8 @@ Nova — Local Voice Assistant (Windows MVP)
 ----------------------------------------
 Features (MVP)
 - Hotword: say "hey nova" to wake.
-- Voice → text: offline using Vosk.
+- Voice → text: offline using Vosk, constrained to the command grammar
+  (set NOVA_FULL_VOCAB=1 for free-form search queries).
 - Intent parser: simple regex + keyword rules.
 - Actions:
   • Open desktop apps (Chrome, VS Code, Notepad, Spotify, etc.)
@@ -36,9 +37,11 @@ import sys
 import time
 import json
 import queue
+import shutil
 import threading
 import subprocess
 import webbrowser
+from collections import deque
 from datetime import datetime
 
 # === Third‑party deps ===
@@ -51,19 +54,47 @@ try:
     import win32gui
     import win32con
     import win32api
+    import pythoncom
 except Exception:
     # Non-critical on non-Windows
-    win32gui = win32con = win32api = None
+    win32gui = win32con = win32api = pythoncom = None
 
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
+try:
+    import mss  # pip install mss: direct GDI capture, much faster than pyautogui
+    from PIL import Image
+except Exception:
+    mss = None
+
+try:
+    import orjson  # pip install orjson: faster parsing of recognizer results
+    json_loads = orjson.loads
+except Exception:
+    json_loads = json.loads
+
+try:
+    # pip install pycaw comtypes: set the master volume in one COM call
+    from ctypes import cast, POINTER
+    from comtypes import CLSCTX_ALL
+    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+    _iface = AudioUtilities.GetSpeakers().Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    endpoint_volume = cast(_iface, POINTER(IAudioEndpointVolume))
+except Exception:
+    endpoint_volume = None
+
 # ---------------- Config ---------------- #
 VOSK_MODEL_DIR = os.environ.get("VOSK_MODEL_DIR", r"vosk-model-small-en-us-0.15")
 SAMPLE_RATE = 16000
-WAKE_WORD = "hey Nova"
+BLOCK_SIZE = 3200  # 200 ms at 16 kHz, matches Vosk's internal chunking
+VOLUME_STEP = 0.2  # same change as the 10 media-key taps (2% each) used without pycaw
+WAKE_WORD = "hey nova"  # lower-case: transcripts are compared as-is
+# Set NOVA_FULL_VOCAB=1 to decode with the full model vocabulary (needed for
+# free-form search queries); by default the recognizer only knows our commands.
+FULL_VOCAB = os.environ.get("NOVA_FULL_VOCAB") == "1"
 
 # Map friendly names to absolute paths (adjust to your system)
 APP_PATHS = {
@@ -75,6 +106,15 @@ APP_PATHS = {
     "calculator": r"calc.exe",
 }
 
+# Expand %USERNAME% etc. once and note which apps are actually installed
+APP_PATHS = {k: os.path.expandvars(v) for k, v in APP_PATHS.items()}
+_APP_EXISTS = {k: os.path.isfile(v) or shutil.which(v) is not None for k, v in APP_PATHS.items()}
+# Launch URLs with a known browser directly; webbrowser.open re-resolves the default browser every call
+_BROWSER_CMD = next((APP_PATHS[k] for k in ("chrome", "edge") if _APP_EXISTS.get(k)), None)
+
+# Spoken names that mean an APP_PATHS key
+APP_ALIASES = {"google": "chrome", "visual studio code": "vscode", "code": "vscode"}
+
 WEBSITES = {
     "youtube": "https://www.youtube.com",
     "gmail": "https://mail.google.com",
@@ -84,47 +124,112 @@ WEBSITES = {
     "stackoverflow": "https://stackoverflow.com",
 }
 
+# Fixed command phrases for the grammar-constrained recognizer
+COMMAND_PHRASES = [
+    "search for", "google", "lookup",
+    "what time is it", "time",
+    "volume up", "increase volume", "volume down", "decrease volume",
+    "mute", "mute volume", "take a screenshot", "screenshot",
+    "stop", "go to sleep", "sleep",
+]
+
+
+def build_grammar() -> str:
+    # JSON phrase list for KaldiRecognizer; decoding collapses to a tiny graph
+    phrases = [WAKE_WORD, *COMMAND_PHRASES]
+    phrases += [f"{verb} {app}" for verb in ("open", "launch", "start") for app in (*APP_PATHS, *APP_ALIASES)]
+    phrases += [f"open {site}" for site in WEBSITES]
+    return json.dumps(phrases + ["[unk]"])
+
 # -------------- TTS helper -------------- #
 class Speaker:
+    __slots__ = ("q", "worker", "engine")
+
     def __init__(self):
-        self.engine = pyttsx3.init()
-        # Choose a slightly faster rate than default
-        self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
-        self.lock = threading.Lock()
+        # Speech plays on a worker thread so say() never blocks command handling
+        self.q: queue.Queue[str] = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def _run(self):
+        # The SAPI engine is a COM object: create and drive it on this thread only
+        try:
+            if pythoncom:
+                pythoncom.CoInitialize()
+            self.engine = pyttsx3.init()
+            # Choose a slightly faster rate than default
+            self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
+        except Exception as e:
+            # Keep draining the queue so replies still show up as text
+            print(f"[tts] speech engine failed to start, printing replies instead: {e}")
+            self.engine = None
+        while True:
+            text = self.q.get()
+            if self.engine is None:
+                print(f"[tts] {text}")
+                continue
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"[tts] couldn't speak {text!r}: {e}")
 
     def say(self, text: str):
-        with self.lock:
-            self.engine.say(text)
-            self.engine.runAndWait()
+        self.q.put(text)
 
 speaker = Speaker()
 
+def normalize(t: str) -> str:
+    return re.sub(r"\s+", " ", t.strip().lower())
+
 # -------------- STT stream -------------- #
 class Listener:
-    def __init__(self, model_dir: str, sample_rate: int):
+    # Fixed attribute layout: cheaper self.x lookups in the audio/dispatch hot path
+    __slots__ = ("model_dir", "grammar", "model", "rec", "sample_rate", "q", "_ready", "_free", "stream",
+                 "stop_flag", "text_buffer")
+
+    def __init__(self, model_dir: str, sample_rate: int, grammar: str | None = None):
         if not os.path.isdir(model_dir):
             raise RuntimeError(f"Vosk model not found at: {model_dir}")
-        self.model = Model(model_dir)
-        self.rec = KaldiRecognizer(self.model, sample_rate)
-        self.rec.SetWords(True)
+        self.model_dir = model_dir
+        self.grammar = grammar
+        self.model = None
+        self.rec = None
         self.sample_rate = sample_rate
-        self.q = queue.Queue()
+        # deque append/popleft are atomic under the GIL, so the audio callback never blocks on a lock
+        self.q: deque[bytearray] = deque(maxlen=32)
+        self._ready = threading.Event()
+        # Recycled block buffers, so the audio callback copies instead of allocating
+        self._free: deque[bytearray] = deque(bytearray(BLOCK_SIZE * 2) for _ in range(8))
         self.stream = None
         self.stop_flag = threading.Event()
         self.text_buffer = ""
 
+    def load_model(self):
+        # Takes seconds on a cold start; Nova runs this on a background thread
+        self.model = Model(self.model_dir)
+
+    def build_recognizer(self):
+        if self.grammar:
+            self.rec = KaldiRecognizer(self.model, self.sample_rate, self.grammar)
+        else:
+            self.rec = KaldiRecognizer(self.model, self.sample_rate)
+
     def _callback(self, indata, frames, time_info, status):
         if status:
             # Over/Underrun warnings
             pass
-        self.q.put(bytes(indata))
+        buf = self._free.popleft() if self._free else bytearray(len(indata))
+        buf[:] = indata
+        self.q.append(buf)
+        self._ready.set()
         return None
 
     def start(self):
         self.stop_flag.clear()
         self.stream = sd.RawInputStream(
             samplerate=self.sample_rate,
-            blocksize=8000,
+            blocksize=BLOCK_SIZE,
             dtype='int16',
             channels=1,
             callback=self._callback,
@@ -141,13 +246,24 @@ class Listener:
     def listen_forever(self, on_partial, on_final):
         try:
             while not self.stop_flag.is_set():
-                data = self.q.get()
-                if self.rec.AcceptWaveform(data):
-                    res = json.loads(self.rec.Result())
-                    if txt := res.get("text"):
+                if not self.q:
+                    self._ready.wait(timeout=0.1)
+                    self._ready.clear()
+                    continue
+                data = self.q.popleft()
+                accepted = self.rec.AcceptWaveform(data)
+                self._free.append(data)
+                if accepted:
+                    res = json_loads(self.rec.Result())
+                    # Normalized once here; everything downstream gets clean lower-case text
+                    if txt := normalize(res.get("text", "")):
                         on_final(txt)
                 else:
-                    part = json.loads(self.rec.PartialResult()).get("partial", "")
+                    raw = self.rec.PartialResult()
+                    # Silence yields an empty partial on nearly every block; skip the JSON parse
+                    if '"partial" : ""' in raw or '"partial": ""' in raw:
+                        continue
+                    part = json_loads(raw).get("partial", "")
                     if part:
                         on_partial(part)
         except KeyboardInterrupt:
@@ -163,71 +279,124 @@ VOLUME_DOWN_PAT = re.compile(r"^(volume down|decrease volume)$")
 MUTE_PAT = re.compile(r"^(mute|mute volume)$")
 SCREENSHOT_PAT = re.compile(r"^(take a screenshot|screenshot)$")
 
+# First word -> (pattern, Executor method) candidates, tried in order.
+# Only the one or two relevant patterns run instead of the whole chain.
+INTENT_DISPATCH = {
+    "search": ((SEARCH_PAT, "web_search"),),
+    "google": ((SEARCH_PAT, "web_search"),),
+    "lookup": ((SEARCH_PAT, "web_search"),),
+    "open": ((OPEN_SITE_PAT, "open_site"), (OPEN_APP_PAT, "open_app")),
+    "launch": ((OPEN_APP_PAT, "open_app"),),
+    "start": ((OPEN_APP_PAT, "open_app"),),
+    "what": ((TIME_PAT, "tell_time"),),
+    "time": ((TIME_PAT, "tell_time"),),
+    "volume": ((VOLUME_UP_PAT, "volume_up"), (VOLUME_DOWN_PAT, "volume_down")),
+    "increase": ((VOLUME_UP_PAT, "volume_up"),),
+    "decrease": ((VOLUME_DOWN_PAT, "volume_down"),),
+    "mute": ((MUTE_PAT, "mute"),),
+    "take": ((SCREENSHOT_PAT, "screenshot"),),
+    "screenshot": ((SCREENSHOT_PAT, "screenshot"),),
+}
 
-def normalize(t: str) -> str:
-    return re.sub(r"\s+", " ", t.strip().lower())
+
+def open_url(url: str):
+    if _BROWSER_CMD:
+        try:
+            subprocess.Popen([_BROWSER_CMD, url])
+            return
+        except Exception:
+            pass
+    webbrowser.open(url)
 
 
 class Executor:
+    __slots__ = ("_shots_dir", "_sct")
+
     def __init__(self):
-        pass
+        # Screenshot folder is created once here, not on every shot
+        self._shots_dir = os.path.join(os.path.expanduser("~"), "Pictures")
+        os.makedirs(self._shots_dir, exist_ok=True)
+        # Reuse one capture context instead of recreating the device context per shot
+        self._sct = mss.mss() if mss else None
 
     def open_app(self, name: str):
-        key = name.strip().lower()
-        # common aliases
-        aliases = {"google": "chrome", "visual studio code": "vscode", "code": "vscode"}
-        key = aliases.get(key, key)
+        key = APP_ALIASES.get(name, name)
         path = APP_PATHS.get(key)
         if not path:
             speaker.say(f"I don't know where {name} is. Update my app paths.")
             return
+        if not _APP_EXISTS[key]:
+            speaker.say(f"{name} isn't installed where my app paths say.")
+            return
         try:
-            subprocess.Popen(os.path.expandvars(path))
+            subprocess.Popen(path)
             speaker.say(f"Opening {name}.")
         except Exception as e:
             speaker.say(f"Couldn't open {name}.")
 
     def web_search(self, query: str):
+        # The command grammar has no free-form words, so a query there decodes as [unk] only
+        if set(query.split()) <= {"[unk]"}:
+            speaker.say("Search needs the full vocabulary. Set NOVA FULL VOCAB to 1.")
+            print("[search] query not recognised; set NOVA_FULL_VOCAB=1 for free-form search")
+            return
         url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-        webbrowser.open(url)
+        open_url(url)
         speaker.say(f"Searching for {query}.")
 
     def open_site(self, key: str):
-        url = WEBSITES.get(key.lower())
+        url = WEBSITES.get(key)
         if url:
-            webbrowser.open(url)
+            open_url(url)
             speaker.say(f"Opening {key}.")
+        elif APP_ALIASES.get(key, key) in APP_PATHS:
+            # "open <app>" matches OPEN_SITE_PAT first; hand app names on to open_app
+            self.open_app(key)
         else:
             speaker.say(f"I don't know the site {key}.")
 
     def tell_time(self):
-        now = datetime.now().strftime("%I:%M %p")
-        speaker.say(f"It's {now}.")
+        t = time.localtime()
+        hour = t.tm_hour % 12 or 12
+        ampm = "AM" if t.tm_hour < 12 else "PM"
+        speaker.say(f"It's {hour}:{t.tm_min:02d} {ampm}.")
 
     def volume_up(self):
-        if win32api:
+        if endpoint_volume:
+            level = endpoint_volume.GetMasterVolumeLevelScalar()
+            endpoint_volume.SetMasterVolumeLevelScalar(min(1.0, level + VOLUME_STEP), None)
+        elif win32api:
             for _ in range(10):
                 win32api.keybd_event(0xAF, 0, 0, 0)  # VK_VOLUME_UP
         speaker.say("Volume up.")
 
     def volume_down(self):
-        if win32api:
+        if endpoint_volume:
+            level = endpoint_volume.GetMasterVolumeLevelScalar()
+            endpoint_volume.SetMasterVolumeLevelScalar(max(0.0, level - VOLUME_STEP), None)
+        elif win32api:
             for _ in range(10):
                 win32api.keybd_event(0xAE, 0, 0, 0)  # VK_VOLUME_DOWN
         speaker.say("Volume down.")
 
     def mute(self):
-        if win32api:
+        if endpoint_volume:
+            endpoint_volume.SetMute(1, None)
+        elif win32api:
             win32api.keybd_event(0xAD, 0, 0, 0)  # VK_VOLUME_MUTE
         speaker.say("Muted.")
 
     def screenshot(self):
-        if pyautogui:
+        if self._sct or pyautogui:
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            fname = os.path.join(os.path.expanduser("~"), f"Pictures\\Nova_Screenshot_{ts}.png")
-            os.makedirs(os.path.dirname(fname), exist_ok=True)
-            img = pyautogui.screenshot()
-            img.save(fname)
+            fname = os.path.join(self._shots_dir, f"Nova_Screenshot_{ts}.png")
+            if self._sct:
+                shot = self._sct.grab(self._sct.monitors[1])
+                # Low PNG compression: the spoken reply waits on the encode
+                Image.frombytes("RGB", shot.size, shot.rgb).save(fname, optimize=False, compress_level=1)
+            else:
+                img = pyautogui.screenshot()
+                img.save(fname)
             speaker.say("Screenshot saved in Pictures.")
         else:
             speaker.say("Screenshot tool not available.")
@@ -237,23 +406,31 @@ executor = Executor()
 
 # -------------- Orchestrator -------------- #
 class Nova:
+    __slots__ = ("listener", "_loader", "awake", "last_partial")
+
     def __init__(self):
-        self.listener = Listener(VOSK_MODEL_DIR, SAMPLE_RATE)
+        grammar = None if FULL_VOCAB else build_grammar()
+        self.listener = Listener(VOSK_MODEL_DIR, SAMPLE_RATE, grammar)
+        # Load the model while the greeting plays instead of before it
+        self._loader = threading.Thread(target=self.listener.load_model, daemon=True)
+        self._loader.start()
         self.awake = False
         self.last_partial = ""
 
     def on_partial(self, text: str):
+        # Vosk repeats the same partial for many blocks; only scan new ones.
+        # Partials are already lower-case, so no per-call lower() either.
+        if self.awake or text == self.last_partial:
+            return
+        self.last_partial = text
         # Detect wake phrase in streaming partials
-        if not self.awake and WAKE_WORD in text.lower():
+        if WAKE_WORD in text:
             self.awake = True
             speaker.say("Listening")
             # Clear last_partial to avoid wake word bleeding
             self.last_partial = ""
 
     def on_final(self, text: str):
-        text = normalize(text)
-        if not text:
-            return
         if not self.awake:
             # also allow wake word in finals
             if WAKE_WORD in text:
@@ -268,33 +445,30 @@ class Nova:
         print(f"Command: {text}")
 
         # Parse intents in order of specificity
-        if m := SEARCH_PAT.match(text):
-            executor.web_search(m.group(2))
-        elif m := OPEN_SITE_PAT.match(text):
-            executor.open_site(m.group(2))
-        elif m := OPEN_APP_PAT.match(text):
-            executor.open_app(m.group(2))
-        elif TIME_PAT.match(text):
-            executor.tell_time()
-        elif VOLUME_UP_PAT.match(text):
-            executor.volume_up()
-        elif VOLUME_DOWN_PAT.match(text):
-            executor.volume_down()
-        elif MUTE_PAT.match(text):
-            executor.mute()
-        elif SCREENSHOT_PAT.match(text):
-            executor.screenshot()
-        elif text in {"stop", "go to sleep", "sleep"}:
-            speaker.say("Going to sleep")
+        head = text.split(" ", 1)[0]
+        for pat, action in INTENT_DISPATCH.get(head, ()):
+            if m := pat.match(text):
+                # group 1 is the verb; any further group is the argument
+                getattr(executor, action)(*m.groups()[1:])
+                break
         else:
-            speaker.say("I didn't catch a supported command.")
+            if text in {"stop", "go to sleep", "sleep"}:
+                speaker.say("Going to sleep")
+            else:
+                speaker.say("I didn't catch a supported command.")
 
         # After handling a command, go back to sleep
         self.awake = False
 
     def run(self):
         print("Nova running. Say 'hey nova' to wake.")
+        if missing := [k for k, ok in _APP_EXISTS.items() if not ok]:
+            print(f"Apps not found (update APP_PATHS): {', '.join(missing)}")
         speaker.say("Nova online")
+        self._loader.join()
+        if self.listener.model is None:
+            raise RuntimeError(f"Could not load Vosk model from: {VOSK_MODEL_DIR}")
+        self.listener.build_recognizer()
         self.listener.start()
         try:
             self.listener.listen_forever(self.on_partial, self.on_final)
@@ -4,24 +4,31 @@ File: mainv1.py
 
 What’s in this build
 - --list-devices to find your microphone index
-- Robust mic start (tries 16000, 44100, 48000 Hz)
+- --list-apps to check which APP_PATHS entries exist on this machine
+- Robust mic start (tries 16000, 44100, 48000 Hz; other rates are resampled to 16 kHz if soxr is installed)
 - --debug prints partial/final transcripts
 - Wake phrase variants: "hey nova", "hello nova", common mishears like "hey noah"
 - --bypass-wake to test intents without wake phrase
+- --endpoint-ms to shorten the silence that ends a command (faster finals)
+- Command-grammar recognizer (full vocabulary with --debug / --bypass-wake)
 - Fuzzy matching for app/site names (e.g., "grown" -> "chrome")
 """
 
 import os
 import re
 import sys
+import time
 import json
 import queue
+import shutil
 import threading
 import subprocess
 import webbrowser
 import argparse
+from collections import deque
 from datetime import datetime
 from difflib import get_close_matches
+from functools import lru_cache
 
 # === Third-party deps ===
 # pip install vosk sounddevice pyttsx3 pywin32 pyautogui
@@ -31,16 +38,53 @@ import pyttsx3
 
 try:
     import win32api  # from pywin32
+    import pythoncom
 except Exception:
-    win32api = None
+    win32api = pythoncom = None
 
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
+try:
+    import mss  # pip install mss: direct GDI capture, much faster than pyautogui
+    from PIL import Image
+except Exception:
+    mss = None
+
+try:
+    import orjson  # pip install orjson: faster parsing of recognizer results
+    json_loads = orjson.loads
+except Exception:
+    json_loads = json.loads
+
+try:
+    # pip install pycaw comtypes: set the master volume in one COM call
+    from ctypes import cast, POINTER
+    from comtypes import CLSCTX_ALL
+    from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume
+    _iface = AudioUtilities.GetSpeakers().Activate(IAudioEndpointVolume._iid_, CLSCTX_ALL, None)
+    endpoint_volume = cast(_iface, POINTER(IAudioEndpointVolume))
+except Exception:
+    endpoint_volume = None
+
+try:
+    import numpy as np
+    import soxr  # pip install soxr: resample 44.1k/48k mics down to 16 kHz
+except Exception:
+    soxr = None
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # pip install rapidfuzz (much faster than difflib)
+except Exception:
+    fuzz = fuzz_process = None
+
 # ---------------- Config ---------------- #
 VOSK_MODEL_DIR = os.environ.get("VOSK_MODEL_DIR", r"vosk-model-small-en-us-0.15")
+SAMPLE_RATE = 16000  # Vosk models are trained at 16 kHz
+BLOCK_SIZE = 3200  # 200 ms at 16 kHz, matches Vosk's internal chunking
+VOLUME_STEP = 0.2  # same change as the 10 media-key taps (2% each) used without pycaw
 
 # Wake patterns (catch common mis-hearings)
 WAKE_WORDS = [
@@ -49,6 +93,8 @@ WAKE_WORDS = [
     r"\bhey\s+noah\b",
     r"\bhey\s+novaa\b",
 ]
+# All wake variants in one pattern: a single scan per partial/final
+_WAKE_RE = re.compile("|".join(WAKE_WORDS), re.IGNORECASE)
 
 # Map friendly names to absolute paths (adjust to your system)
 APP_PATHS = {
@@ -60,6 +106,13 @@ APP_PATHS = {
     "spotify": r"C:\Users\%USERNAME%\AppData\Roaming\Spotify\Spotify.exe",
     "calculator": r"calc.exe",
 }
+
+# Expand %USERNAME% etc. once and note which apps are actually installed
+APP_PATHS = {k: os.path.expandvars(v) for k, v in APP_PATHS.items()}
+_APP_EXISTS = {k: os.path.isfile(v) or shutil.which(v) is not None for k, v in APP_PATHS.items()}
+# Launch URLs with a known browser directly; webbrowser.open re-resolves the default browser every call
+_BROWSER_CMD = next((APP_PATHS[k] for k in ("chrome", "edge") if _APP_EXISTS.get(k)), None)
+
 # Common mis-hears -> canonical app key
 APP_ALIASES = {
     "grown": "chrome",
@@ -80,77 +133,171 @@ WEBSITES = {
     "stackoverflow": "https://stackoverflow.com",
 }
 
+# Fixed command phrases for the grammar-constrained recognizer
+COMMAND_PHRASES = [
+    "search for", "google", "lookup",
+    "what time is it", "time",
+    "volume up", "increase volume", "volume down", "decrease volume",
+    "mute", "mute volume", "take a screenshot", "screenshot",
+    "stop", "go to sleep", "sleep",
+]
+
+
+def build_grammar() -> str:
+    # JSON phrase list for KaldiRecognizer; decoding collapses to a tiny graph
+    wake = [p.replace(r"\b", "").replace(r"\s+", " ") for p in WAKE_WORDS]
+    apps = [*APP_PATHS, *APP_ALIASES]
+    phrases = [*wake, *COMMAND_PHRASES]
+    phrases += [f"{verb} {app}" for verb in ("open", "launch", "start") for app in apps]
+    phrases += [f"open {site}" for site in WEBSITES]
+    return json.dumps(phrases + ["[unk]"])
+
+# Fixed choice lists for fuzzy resolution (tuples so lookups can be cached)
+APP_KEYS = tuple(APP_PATHS)
+SITE_KEYS = tuple(WEBSITES)
+
 # -------------- TTS helper -------------- #
 class Speaker:
+    __slots__ = ("q", "worker", "engine")
+
     def __init__(self):
-        self.engine = pyttsx3.init()
-        self.engine.setProperty("rate", int(self.engine.getProperty("rate") * 0.95))
-        self.lock = threading.Lock()
+        # Speech plays on a worker thread so say() never blocks command handling
+        self.q: queue.Queue[str] = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+
+    def _run(self):
+        # The SAPI engine is a COM object: create and drive it on this thread only
+        try:
+            if pythoncom:
+                pythoncom.CoInitialize()
+            self.engine = pyttsx3.init()
+            self.engine.setProperty("rate", int(self.engine.getProperty("rate") * 0.95))
+        except Exception as e:
+            # Keep draining the queue so replies still show up as text
+            print(f"[tts] speech engine failed to start, printing replies instead: {e}")
+            self.engine = None
+        while True:
+            text = self.q.get()
+            if self.engine is None:
+                print(f"[tts] {text}")
+                continue
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"[tts] couldn't speak {text!r}: {e}")
 
     def say(self, text: str):
-        with self.lock:
-            self.engine.say(text)
-            self.engine.runAndWait()
+        self.q.put(text)
 
 speaker = Speaker()
 
 # -------------- Helpers -------------- #
 def fuzzy_wake(text: str) -> bool:
-    text = text.lower()
-    return any(re.search(p, text) for p in WAKE_WORDS)
+    return _WAKE_RE.search(text) is not None
 
 def normalize(t: str) -> str:
     return re.sub(r"\s+", " ", t.strip().lower())
 
-def resolve_name_fuzzy(name: str, choices: list[str], extra_alias: dict[str, str] | None = None) -> str | None:
-    n = name.strip().lower()
-    if extra_alias and n in extra_alias:
-        return extra_alias[n]
-    if n in choices:
-        return n
-    # try closest match
-    matches = get_close_matches(n, choices, n=1, cutoff=0.7)
+@lru_cache(maxsize=256)
+def closest_match(name: str, choices: tuple[str, ...]) -> str | None:
+    if fuzz_process:
+        best = fuzz_process.extractOne(name, choices, scorer=fuzz.WRatio, score_cutoff=70)
+        return best[0] if best else None
+    matches = get_close_matches(name, choices, n=1, cutoff=0.7)
     return matches[0] if matches else None
 
+def resolve_name_fuzzy(name: str, choices: tuple[str, ...], extra_alias: dict[str, str] | None = None) -> str | None:
+    # name is already normalized (lower-case, single-spaced) by the listener
+    if extra_alias and name in extra_alias:
+        return extra_alias[name]
+    if name in choices:
+        return name
+    # try closest match
+    return closest_match(name, choices)
+
 # -------------- STT stream -------------- #
 class Listener:
-    def __init__(self, model_dir: str, device_idx: int | None, debug: bool):
+    # Fixed attribute layout: cheaper self.x lookups in the audio/dispatch hot path
+    __slots__ = ("model_dir", "model", "grammar", "endpoint_ms", "recognizer", "stream", "q", "_ready", "_free",
+                 "stop_flag", "debug", "device_idx", "active_rate", "_resampler")
+
+    def __init__(self, model_dir: str, device_idx: int | None, debug: bool, grammar: str | None = None,
+                 endpoint_ms: int | None = None):
         if not os.path.isdir(model_dir):
             raise RuntimeError(f"Vosk model not found at: {model_dir}")
-        self.model = Model(model_dir)
+        self.model_dir = model_dir
+        self.model: Model | None = None
+        self.grammar = grammar
+        self.endpoint_ms = endpoint_ms
         self.recognizer: KaldiRecognizer | None = None
         self.stream: sd.RawInputStream | None = None
-        self.q: queue.Queue[bytes] = queue.Queue()
+        # deque append/popleft are atomic under the GIL, so the audio callback never blocks on a lock
+        self.q: deque[bytearray] = deque(maxlen=32)
+        self._ready = threading.Event()
+        # Recycled block buffers, so the audio callback copies instead of allocating
+        self._free: deque[bytearray] = deque(bytearray(BLOCK_SIZE * 2) for _ in range(8))
         self.stop_flag = threading.Event()
         self.debug = debug
         self.device_idx = device_idx
         self.active_rate = None
+        self._resampler = None
+
+    def load_model(self):
+        # Takes seconds on a cold start; Nova runs this on a background thread
+        self.model = Model(self.model_dir)
+
+    def _set_endpoint(self):
+        # Finals wait for trailing silence; a shorter window returns commands sooner
+        if hasattr(self.recognizer, "SetEndpointerDelays"):  # vosk >= 0.3.50
+            self.recognizer.SetEndpointerDelays(5.0, self.endpoint_ms / 1000, 20.0)
+            if self.debug:
+                print(f"[audio] endpoint after {self.endpoint_ms} ms of silence")
+        else:
+            print("[audio] --endpoint-ms needs vosk >= 0.3.50; set the endpoint.rule* options in the model's conf/model.conf instead")
+            self.endpoint_ms = None
 
     def _callback(self, indata, frames, time_info, status):
         if status and self.debug:
             print("[sd status]", status, flush=True)
-        self.q.put(bytes(indata))
+        if self._resampler:
+            # resample_chunk returns an int16 ndarray; view it as raw bytes for the byte buffers below
+            indata = memoryview(self._resampler.resample_chunk(np.frombuffer(indata, dtype=np.int16))).cast("B")
+        buf = self._free.popleft() if self._free else bytearray(len(indata))
+        buf[:] = indata
+        self.q.append(buf)
+        self._ready.set()
         return None
 
     def start(self):
         self.stop_flag.clear()
-        for rate in (16000, 44100, 48000):
+        for rate in (SAMPLE_RATE, 44100, 48000):
             try:
                 if self.debug:
                     print(f"[audio] trying rate {rate} @ device {self.device_idx}")
-                self.recognizer = KaldiRecognizer(self.model, rate)
+                # Always decode at 16 kHz and resample other mic rates; without soxr, decode at the mic rate
+                rec_rate = SAMPLE_RATE if soxr else rate
+                if self.grammar:
+                    self.recognizer = KaldiRecognizer(self.model, rec_rate, self.grammar)
+                else:
+                    self.recognizer = KaldiRecognizer(self.model, rec_rate)
+                if self.endpoint_ms:
+                    self._set_endpoint()
+                if rec_rate != rate:
+                    self._resampler = soxr.ResampleStream(rate, SAMPLE_RATE, 1, dtype="int16", quality="QQ")
+                self.active_rate = rate
                 self.stream = sd.RawInputStream(
                     samplerate=rate,
-                    blocksize=8000,
+                    blocksize=BLOCK_SIZE,
                     dtype="int16",
                     channels=1,
                     device=self.device_idx,
                     callback=self._callback,
                 )
                 self.stream.start()
-                self.active_rate = rate
                 if self.debug:
-                    print(f"[audio] using rate {rate}")
+                    print(f"[audio] using rate {rate}" + (f", resampled to {SAMPLE_RATE}" if self._resampler else ""))
                 return
             except Exception as e:
                 if self.debug:
@@ -162,6 +309,7 @@ class Listener:
                     pass
                 self.stream = None
                 self.recognizer = None
+                self._resampler = None
         raise RuntimeError("Could not start microphone stream at 16k/44.1k/48k. Try another input device (--device).")
 
     def stop(self):
@@ -176,15 +324,26 @@ class Listener:
             raise RuntimeError("Recognizer not initialised.")
         try:
             while not self.stop_flag.is_set():
-                data = self.q.get()
-                if self.recognizer.AcceptWaveform(data):
-                    res = json.loads(self.recognizer.Result())
-                    if txt := res.get("text"):
+                if not self.q:
+                    self._ready.wait(timeout=0.1)
+                    self._ready.clear()
+                    continue
+                data = self.q.popleft()
+                accepted = self.recognizer.AcceptWaveform(data)
+                self._free.append(data)
+                if accepted:
+                    res = json_loads(self.recognizer.Result())
+                    # Normalized once here; everything downstream gets clean lower-case text
+                    if txt := normalize(res.get("text", "")):
                         if self.debug:
                             print("final:", txt)
                         on_final(txt)
                 else:
-                    part = json.loads(self.recognizer.PartialResult()).get("partial", "")
+                    raw = self.recognizer.PartialResult()
+                    # Silence yields an empty partial on nearly every block; skip the JSON parse
+                    if '"partial" : ""' in raw or '"partial": ""' in raw:
+                        continue
+                    part = json_loads(raw).get("partial", "")
                     if part:
                         if self.debug:
                             print("partial:", part)
@@ -202,62 +361,124 @@ VOLUME_DOWN_PAT= re.compile(r"^(volume down|decrease volume)$")
 MUTE_PAT       = re.compile(r"^(mute|mute volume)$")
 SCREENSHOT_PAT = re.compile(r"^(take a screenshot|screenshot)$")
 
+# First word -> (pattern, Executor method) candidates, tried in order.
+# Only the one or two relevant patterns run instead of the whole chain.
+INTENT_DISPATCH = {
+    "search": ((SEARCH_PAT, "web_search"),),
+    "google": ((SEARCH_PAT, "web_search"),),
+    "lookup": ((SEARCH_PAT, "web_search"),),
+    "open": ((OPEN_SITE_PAT, "open_site"), (OPEN_APP_PAT, "open_app")),
+    "launch": ((OPEN_APP_PAT, "open_app"),),
+    "start": ((OPEN_APP_PAT, "open_app"),),
+    "what": ((TIME_PAT, "tell_time"),),
+    "time": ((TIME_PAT, "tell_time"),),
+    "volume": ((VOLUME_UP_PAT, "volume_up"), (VOLUME_DOWN_PAT, "volume_down")),
+    "increase": ((VOLUME_UP_PAT, "volume_up"),),
+    "decrease": ((VOLUME_DOWN_PAT, "volume_down"),),
+    "mute": ((MUTE_PAT, "mute"),),
+    "take": ((SCREENSHOT_PAT, "screenshot"),),
+    "screenshot": ((SCREENSHOT_PAT, "screenshot"),),
+}
+
+def open_url(url: str):
+    if _BROWSER_CMD:
+        try:
+            subprocess.Popen([_BROWSER_CMD, url])
+            return
+        except Exception:
+            pass
+    webbrowser.open(url)
+
 class Executor:
+    __slots__ = ("_shots_dir", "_sct")
+
+    def __init__(self):
+        # Screenshot folder is created once here, not on every shot
+        self._shots_dir = os.path.join(os.path.expanduser("~"), "Pictures")
+        os.makedirs(self._shots_dir, exist_ok=True)
+        # Reuse one capture context instead of recreating the device context per shot
+        self._sct = mss.mss() if mss else None
+
     def open_app(self, name: str):
         # alias then fuzzy
-        key = APP_ALIASES.get(name.strip().lower(), name.strip().lower())
-        choice = resolve_name_fuzzy(key, list(APP_PATHS.keys()), APP_ALIASES)
+        key = APP_ALIASES.get(name, name)
+        choice = resolve_name_fuzzy(key, APP_KEYS, APP_ALIASES)
         if not choice:
             speaker.say(f"I couldn't find an app like {name}.")
             return
-        path = APP_PATHS.get(choice)
+        if not _APP_EXISTS[choice]:
+            speaker.say(f"{choice} isn't installed where my app paths say.")
+            return
         try:
-            subprocess.Popen(os.path.expandvars(path))
+            subprocess.Popen(APP_PATHS[choice])
             speaker.say(f"Opening {choice}.")
         except Exception:
             speaker.say(f"Couldn't open {choice}.")
 
     def web_search(self, query: str):
+        # The command grammar has no free-form words, so a query there decodes as [unk] only
+        if set(query.split()) <= {"[unk]"}:
+            speaker.say("Search needs the full vocabulary. Run me with debug or bypass wake.")
+            print("[search] query not recognised; run with --debug or --bypass-wake for free-form search")
+            return
         url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
-        webbrowser.open(url)
+        open_url(url)
         speaker.say(f"Searching for {query}.")
 
     def open_site(self, key: str):
-        choice = resolve_name_fuzzy(key, list(WEBSITES.keys()))
+        choice = resolve_name_fuzzy(key, SITE_KEYS)
         if not choice:
-            speaker.say(f"I don't know the site {key}.")
+            # "open <app>" matches OPEN_SITE_PAT first; hand app names on to open_app
+            if resolve_name_fuzzy(key, APP_KEYS, APP_ALIASES):
+                self.open_app(key)
+            else:
+                speaker.say(f"I don't know the site {key}.")
             return
-        webbrowser.open(WEBSITES[choice])
+        open_url(WEBSITES[choice])
         speaker.say(f"Opening {choice}.")
 
     def tell_time(self):
-        now = datetime.now().strftime("%I:%M %p")
-        speaker.say(f"It's {now}.")
+        t = time.localtime()
+        hour = t.tm_hour % 12 or 12
+        ampm = "AM" if t.tm_hour < 12 else "PM"
+        speaker.say(f"It's {hour}:{t.tm_min:02d} {ampm}.")
 
     def volume_up(self):
-        if win32api:
+        if endpoint_volume:
+            level = endpoint_volume.GetMasterVolumeLevelScalar()
+            endpoint_volume.SetMasterVolumeLevelScalar(min(1.0, level + VOLUME_STEP), None)
+        elif win32api:
             for _ in range(10):
                 win32api.keybd_event(0xAF, 0, 0, 0)  # VK_VOLUME_UP
         speaker.say("Volume up.")
 
     def volume_down(self):
-        if win32api:
+        if endpoint_volume:
+            level = endpoint_volume.GetMasterVolumeLevelScalar()
+            endpoint_volume.SetMasterVolumeLevelScalar(max(0.0, level - VOLUME_STEP), None)
+        elif win32api:
             for _ in range(10):
                 win32api.keybd_event(0xAE, 0, 0, 0)  # VK_VOLUME_DOWN
         speaker.say("Volume down.")
 
     def mute(self):
-        if win32api:
+        if endpoint_volume:
+            endpoint_volume.SetMute(1, None)
+        elif win32api:
             win32api.keybd_event(0xAD, 0, 0, 0)  # VK_VOLUME_MUTE
         speaker.say("Muted.")
 
     def screenshot(self):
-        if pyautogui:
+        if self._sct or pyautogui:
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            fname = os.path.join(os.path.expanduser("~"), f"Pictures\\Nova_Screenshot_{ts}.png")
-            os.makedirs(os.path.dirname(fname), exist_ok=True)
-            img = pyautogui.screenshot()
-            img.save(fname)
+            fname = os.path.join(self._shots_dir, f"Nova_Screenshot_{ts}.png")
+            if self._sct:
+                shot = self._sct.grab(self._sct.monitors[1])
+                # Low PNG compression: the spoken reply waits on the encode
+                Image.frombytes("RGB", shot.size, shot.rgb).save(fname, optimize=False, compress_level=1)
+            else:
+                img = pyautogui.screenshot()
+                img.save(fname)
             speaker.say("Screenshot saved in Pictures.")
         else:
             speaker.say("Screenshot tool not available.")
@@ -266,8 +487,15 @@ executor = Executor()
 
 # -------------- Orchestrator -------------- #
 class Nova:
-    def __init__(self, device_idx: int | None, debug: bool, bypass_wake: bool):
-        self.listener = Listener(VOSK_MODEL_DIR, device_idx, debug)
+    __slots__ = ("listener", "_loader", "awake", "debug", "bypass_wake")
+
+    def __init__(self, device_idx: int | None, debug: bool, bypass_wake: bool, endpoint_ms: int | None = None):
+        # Full vocabulary only for debugging/testing; normal runs decode against the command grammar
+        grammar = None if (debug or bypass_wake) else build_grammar()
+        self.listener = Listener(VOSK_MODEL_DIR, device_idx, debug, grammar, endpoint_ms)
+        # Load the model while the greeting plays instead of before it
+        self._loader = threading.Thread(target=self.listener.load_model, daemon=True)
+        self._loader.start()
         self.awake = bypass_wake
         self.debug = debug
         self.bypass_wake = bypass_wake
@@ -278,51 +506,44 @@ class Nova:
             speaker.say("Listening")
 
     def on_final(self, text: str):
-        text = normalize(text)
-        if not text:
-            return
         if not self.awake:
             if fuzzy_wake(text):
                 self.awake = True
                 speaker.say("Ready")
             return
 
-        # strip wake words if they appear again
-        for pat in WAKE_WORDS:
-            text = re.sub(pat, "", text, flags=re.IGNORECASE).strip()
+        # strip wake words if they appear again (most commands don't contain one)
+        if _WAKE_RE.search(text):
+            text = normalize(_WAKE_RE.sub("", text))
         if not text:
             return
 
         print(f"Command: {text}")
 
         # Parse intents (order matters)
-        if m := SEARCH_PAT.match(text):
-            executor.web_search(m.group(2))
-        elif m := OPEN_SITE_PAT.match(text):
-            executor.open_site(m.group(2))
-        elif m := OPEN_APP_PAT.match(text):
-            executor.open_app(m.group(2))
-        elif TIME_PAT.match(text):
-            executor.tell_time()
-        elif VOLUME_UP_PAT.match(text):
-            executor.volume_up()
-        elif VOLUME_DOWN_PAT.match(text):
-            executor.volume_down()
-        elif MUTE_PAT.match(text):
-            executor.mute()
-        elif SCREENSHOT_PAT.match(text):
-            executor.screenshot()
-        elif text in {"stop", "go to sleep", "sleep"}:
-            speaker.say("Going to sleep")
+        head = text.split(" ", 1)[0]
+        for pat, action in INTENT_DISPATCH.get(head, ()):
+            if m := pat.match(text):
+                # group 1 is the verb; any further group is the argument
+                getattr(executor, action)(*m.groups()[1:])
+                break
         else:
-            speaker.say("I didn't catch a supported command.")
+            if text in {"stop", "go to sleep", "sleep"}:
+                speaker.say("Going to sleep")
+            else:
+                speaker.say("I didn't catch a supported command.")
 
         # After handling a command, go back to sleep unless bypassing
         self.awake = self.bypass_wake
 
     def run(self):
         print("Nova running. Say 'hey nova' (or 'hello nova') to wake.")
+        if missing := [k for k, ok in _APP_EXISTS.items() if not ok]:
+            print(f"Apps not found (update APP_PATHS or run --list-apps): {', '.join(missing)}")
         speaker.say("Nova online")
+        self._loader.join()
+        if self.listener.model is None:
+            raise RuntimeError(f"Could not load Vosk model from: {VOSK_MODEL_DIR}")
         self.listener.start()
         try:
             self.listener.listen_forever(self.on_partial, self.on_final)
@@ -332,17 +553,24 @@ class Nova:
 def main():
     parser = argparse.ArgumentParser()
     parser.add_argument("--list-devices", action="store_true", help="List audio devices and exit")
+    parser.add_argument("--list-apps", action="store_true", help="List configured apps and whether they were found, then exit")
     parser.add_argument("--device", type=int, default=None, help="Input device index to use")
     parser.add_argument("--debug", action="store_true", help="Print partial/final transcripts and audio logs")
     parser.add_argument("--bypass-wake", action="store_true", help="Start already awake (for testing)")
+    parser.add_argument("--endpoint-ms", type=int, default=None, help="Trailing silence (ms) that ends a command, e.g. 300 for faster replies")
     args = parser.parse_args()
 
     if args.list_devices:
         print(sd.query_devices())
         return
 
+    if args.list_apps:
+        for name, path in APP_PATHS.items():
+            print(f"{'ok' if _APP_EXISTS[name] else 'missing':>7}  {name}: {path}")
+        return
+
     try:
-        Nova(device_idx=args.device, debug=args.debug, bypass_wake=args.bypass_wake).run()
+        Nova(device_idx=args.device, debug=args.debug, bypass_wake=args.bypass_wake, endpoint_ms=args.endpoint_ms).run()
     except RuntimeError as e:
         print(f"Error: {e}")
         print("Make sure VOSK_MODEL_DIR points to a valid model folder or pass --device to select the right mic.")
@@ -27,8 +27,11 @@ import threading
 import subprocess
 import webbrowser
 import argparse
+import ctypes
 from datetime import datetime
 from difflib import get_close_matches
+from functools import lru_cache
+from urllib.parse import quote_plus
 
 from vosk import Model, KaldiRecognizer
 import sounddevice as sd
@@ -36,18 +39,42 @@ import pyttsx3
 
 try:
     import win32api
+    import pythoncom
 except Exception:
-    win32api = None
+    win32api = pythoncom = None
+
+try:
+    _user32 = ctypes.windll.user32  # SendInput: a whole key burst in one call
+except Exception:
+    _user32 = None
 
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # pip install rapidfuzz (much faster than difflib)
+except Exception:
+    fuzz = fuzz_process = None
+
+try:
+    import orjson  # pip install orjson: faster parsing of recognizer results
+    json_loads = orjson.loads
+except Exception:
+    json_loads = json.loads
+
+try:
+    import ahocorasick  # pip install pyahocorasick: confusion rewrites in one automaton pass
+except Exception:
+    ahocorasick = None
+
 # -------- Config -------- #
 VOSK_MODEL_DIR = os.environ.get("VOSK_MODEL_DIR", r"vosk-model-small-en-us-0.15")
 WAKE_WORDS = [r"\bhey\s+nova\b", r"\bhello\s+nova\b", r"\bhey\s+noah\b", r"\bhey\s+novaa\b"]
 INTENT_VERBS = {"open", "search", "google", "lookup", "close", "time", "what time is it", "volume", "mute", "screenshot"}
+_GATE_VERBS = frozenset({"open", "search", "google", "lookup", "close", "time", "what"})
+_PICTURES_DIR = os.path.join(os.path.expanduser("~"), "Pictures")
 
 # App paths (adjust if needed)
 APP_PATHS = {
@@ -122,46 +149,133 @@ SITE_ALIASES = {
     "good": "github"
 }
 
+# Speech reaches the resolvers already normalized (lowercase, stripped), so the keys
+# are normalized once here instead of lowering the input on every lookup
+APP_PATHS = {k.strip().lower(): v for k, v in APP_PATHS.items()}
+WEBSITES = {k.strip().lower(): v for k, v in WEBSITES.items()}
+APP_ALIASES = {k.strip().lower(): v.strip().lower() for k, v in APP_ALIASES.items()}
+SITE_ALIASES = {k.strip().lower(): v.strip().lower() for k, v in SITE_ALIASES.items()}
+
+# Fuzzy-match candidates, built once instead of per command
+APP_KEYS = tuple(APP_PATHS)
+SITE_KEYS = tuple(WEBSITES)
+APP_KEYS_SET = frozenset(APP_KEYS)
+SITE_KEYS_SET = frozenset(SITE_KEYS)
+
+# Text-cleanup regexes, compiled once at import
+_WAKE_RE = re.compile("|".join(f"(?:{p})" for p in WAKE_WORDS), re.IGNORECASE)
+_CONFUSION_MAP = {k.lower(): v for k, v in CONFUSIONS.items()}
+# longer keys first so "oh been" wins over "been"; sorted once, shared by both matchers
+_CONFUSION_KEYS_SORTED = tuple(sorted(_CONFUSION_MAP, key=len, reverse=True))
+_CONFUSION_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in _CONFUSION_KEYS_SORTED) + r")\b")
+_WS_RE = re.compile(r"\s+")
+
+# Same rewrite as _CONFUSION_RE, as an Aho-Corasick automaton: cost stays linear in the
+# transcript however many confusions get added
+if ahocorasick:
+    _CONFUSION_AC = ahocorasick.Automaton()
+    for _k in _CONFUSION_KEYS_SORTED:
+        _CONFUSION_AC.add_word(_k, (len(_k), _CONFUSION_MAP[_k]))
+    _CONFUSION_AC.make_automaton()
+else:
+    _CONFUSION_AC = None
+
 # -------- TTS -------- #
 class Speaker:
     def __init__(self):
-        self.engine = pyttsx3.init()
-        self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
-        self.lock = threading.Lock()
+        # speech plays on a worker thread so say() never blocks listening
+        self.q: queue.Queue[str] = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+    def _run(self):
+        # the SAPI engine is a COM object: create and drive it on this thread only
+        try:
+            if pythoncom:
+                pythoncom.CoInitialize()
+            self.engine = pyttsx3.init()
+            self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
+        except Exception as e:
+            # keep draining the queue so replies still show up as text
+            print(f"[tts] speech engine failed to start, printing replies instead: {e}")
+            self.engine = None
+        while True:
+            text = self.q.get()
+            if self.engine is None:
+                print(f"[tts] {text}")
+                continue
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"[tts] couldn't speak {text!r}: {e}")
     def say(self, text: str):
-        with self.lock:
-            self.engine.say(text)
-            self.engine.runAndWait()
+        self.q.put(text)
 
 speaker = Speaker()
 
 # -------- Utils -------- #
 def fuzzy_wake(text: str) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in WAKE_WORDS)
+    return _WAKE_RE.search(text) is not None
 
 def normalize(t: str) -> str:
     t = t.lower().strip()
-    t = re.sub(r"\s+", " ", t)
+    t = _WS_RE.sub(" ", t)
     return t
 
-def apply_confusions(t: str) -> str:
-    # replace longer keys first
-    keys = sorted(CONFUSIONS.keys(), key=len, reverse=True)
-    for k in keys:
-        t = re.sub(rf"\b{re.escape(k)}\b", CONFUSIONS[k], t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+def _word_boundary(t: str, i: int) -> bool:
+    # same test as regex \b between t[i-1] and t[i]
+    left = i > 0 and (t[i - 1].isalnum() or t[i - 1] == "_")
+    right = i < len(t) and (t[i].isalnum() or t[i] == "_")
+    return left != right
+
+def _replace_confusions_ac(t: str) -> str:
+    # keep leftmost-longest, non-overlapping, whole-word hits (what the regex alternation does)
+    hits = []
+    for end, (size, repl) in _CONFUSION_AC.iter(t):
+        start = end - size + 1
+        if _word_boundary(t, start) and _word_boundary(t, end + 1):
+            hits.append((start, end + 1, repl))
+    hits.sort(key=lambda h: (h[0], -h[1]))
+    out, pos = [], 0
+    for start, stop, repl in hits:
+        if start < pos:
+            continue
+        out.append(t[pos:start])
+        out.append(repl)
+        pos = stop
+    out.append(t[pos:])
+    return "".join(out)
 
-def resolve_name_fuzzy(name: str, choices: list[str], extra_alias: dict[str, str] | None = None) -> str | None:
-    n = name.strip().lower()
-    if extra_alias and n in extra_alias:
-        n = extra_alias[n]
-    if n in choices:
+def apply_confusions(t: str) -> str:
+    # single left-to-right pass over the text, whatever the number of confusions
+    if _CONFUSION_AC:
+        t = _replace_confusions_ac(t)
+    else:
+        t = _CONFUSION_RE.sub(lambda m: _CONFUSION_MAP[m.group(1)], t)
+    return _WS_RE.sub(" ", t).strip()
+
+def resolve_name_fuzzy(name: str, choices: tuple[str, ...], choices_set: frozenset[str],
+                       extra_alias: dict[str, str] | None = None) -> str | None:
+    # name comes from normalize()d speech: already lowercase and stripped
+    n = extra_alias.get(name, name) if extra_alias else name
+    # exact key: O(1) hash hit, skip the fuzzy scan
+    if n in choices_set:
         return n
+    if fuzz_process:
+        best = fuzz_process.extractOne(n, choices, scorer=fuzz.WRatio, score_cutoff=70)
+        return best[0] if best else None
     matches = get_close_matches(n, choices, n=1, cutoff=0.7)
     return matches[0] if matches else None
 
+# Same few names are spoken again and again; the alias/choice maps never change at runtime
+@lru_cache(maxsize=512)
+def _resolve_app(name: str) -> str | None:
+    return resolve_name_fuzzy(name, APP_KEYS, APP_KEYS_SET, APP_ALIASES)
+
+@lru_cache(maxsize=512)
+def _resolve_site(name: str) -> str | None:
+    return resolve_name_fuzzy(name, SITE_KEYS, SITE_KEYS_SET, SITE_ALIASES)
+
 # -------- Listener -------- #
 class Listener:
     def __init__(self, model_dir: str, device_idx: int | None, debug: bool):
@@ -174,6 +288,8 @@ class Listener:
         self.stop_flag = threading.Event()
         self.debug = debug
         self.device_idx = device_idx
+        # raw partial JSON last seen; unchanged partials are not parsed again
+        self._last_partial = ""
 
     def _callback(self, indata, frames, time_info, status):
         if status and self.debug:
@@ -224,13 +340,17 @@ class Listener:
             while not self.stop_flag.is_set():
                 data = self.q.get()
                 if self.rec.AcceptWaveform(data):
-                    res = json.loads(self.rec.Result())
+                    res = json_loads(self.rec.Result())
                     if txt := res.get("text"):
                         if self.debug:
                             print("final:", txt)
                         on_final(txt)
                 else:
-                    part = json.loads(self.rec.PartialResult()).get("partial", "")
+                    raw = self.rec.PartialResult()
+                    if raw == self._last_partial:
+                        continue
+                    self._last_partial = raw
+                    part = json_loads(raw).get("partial", "")
                     if part and self.debug:
                         print("partial:", part)
                     if part:
@@ -238,24 +358,83 @@ class Listener:
         except KeyboardInterrupt:
             return
 
+# -------- Key input -------- #
+KEYEVENTF_KEYUP = 0x0002
+INPUT_KEYBOARD = 1
+VK_VOLUME_MUTE, VK_VOLUME_DOWN, VK_VOLUME_UP = 0xAD, 0xAE, 0xAF
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class MOUSEINPUT(ctypes.Structure):
+    # only here so the INPUT union has its real size
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+def _key_taps(vk: int, count: int):
+    # count down+up pairs in one INPUT array
+    arr = (INPUT * (count * 2))()
+    for i, ev in enumerate(arr):
+        ev.type = INPUT_KEYBOARD
+        ev.u.ki.wVk = vk
+        ev.u.ki.dwFlags = KEYEVENTF_KEYUP if i % 2 else 0
+    return arr
+
+# built once; each command replays its array with a single SendInput call
+_KEY_TAPS = {
+    VK_VOLUME_UP: _key_taps(VK_VOLUME_UP, 10),
+    VK_VOLUME_DOWN: _key_taps(VK_VOLUME_DOWN, 10),
+    VK_VOLUME_MUTE: _key_taps(VK_VOLUME_MUTE, 1),
+}
+
+def tap_keys(vk: int) -> bool:
+    taps = _KEY_TAPS[vk]
+    if _user32:
+        _user32.SendInput(len(taps), taps, ctypes.sizeof(INPUT))
+        return True
+    if win32api:
+        for _ in range(len(taps) // 2):
+            win32api.keybd_event(vk, 0, 0, 0)
+            win32api.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
+        return True
+    return False
+
 # -------- Intents -------- #
-OPEN_APP_PAT   = re.compile(r"^(open|launch|start)\s+(.+)$")
-OPEN_SITE_PAT  = re.compile(r"^(open)\s+(.+)$")
-SEARCH_PAT     = re.compile(r"^(search for|google|lookup)\s+(.+)$")
-CLOSE_PAT      = re.compile(r"^(close)\s+(.+)$")
-TIME_PAT       = re.compile(r"^(what\s+time\s+is\s+it|time)$")
-VOLUME_UP_PAT  = re.compile(r"^(volume up|increase volume)$")
-VOLUME_DOWN_PAT= re.compile(r"^(volume down|decrease volume)$")
-MUTE_PAT       = re.compile(r"^(mute|mute volume)$")
-SCREENSHOT_PAT = re.compile(r"^(take a screenshot|screenshot)$")
+# All intents in one anchored alternation: a single match per command, and the
+# outer named group that matched (m.lastgroup) picks the handler in _DISPATCH
+_INTENT_RE = re.compile(
+    r"^(?:"
+    r"(?P<search>(?:search for|google|lookup)\s+(?P<query>.+))"
+    r"|(?P<close>close\s+(?P<close_target>.+))"
+    r"|(?P<open>open\s+(?P<open_target>.+))"
+    r"|(?P<launch>(?:launch|start)\s+(?P<app>.+))"
+    r"|(?P<time>what\s+time\s+is\s+it|time)"
+    r"|(?P<volume_up>volume up|increase volume)"
+    r"|(?P<volume_down>volume down|decrease volume)"
+    r"|(?P<mute>mute|mute volume)"
+    r"|(?P<screenshot>take a screenshot|screenshot)"
+    r")$"
+)
+
+def app_name(phrase: str) -> str:
+    # "chrome for me" / "spotify on speakers" -> the app part only
+    return phrase.split(" for ")[0].split(" on ")[0].strip()
 
 class Executor:
+    def __init__(self):
+        # Pictures dir is created on the first screenshot only
+        self._pictures_ready = False
+
     def open_app(self, phrase: str):
-        # take first 1-2 tokens as candidate app name
-        target = phrase.split(" for ")[0].split(" on ")[0]
-        target = target.strip()
-        key = APP_ALIASES.get(target, target)
-        choice = resolve_name_fuzzy(key, list(APP_PATHS.keys()), APP_ALIASES)
+        target = app_name(phrase)
+        choice = _resolve_app(target)
         if not choice:
             speaker.say(f"I couldn't find an app like {target}.")
             return
@@ -265,10 +444,19 @@ class Executor:
         except Exception:
             speaker.say(f"Couldn't open {choice}.")
 
+    def open_target(self, phrase: str):
+        # "open X": a known site (exact/alias) first, then an app, then a fuzzy site match
+        target = phrase.strip()
+        if SITE_ALIASES.get(target, target) in SITE_KEYS_SET:
+            return self.open_site(target)
+        if _resolve_app(app_name(target)):
+            return self.open_app(target)
+        return self.open_site(target)
+
     def open_site(self, phrase: str):
         target = phrase.strip()
         target = SITE_ALIASES.get(target, target)
-        choice = resolve_name_fuzzy(target, list(WEBSITES.keys()), SITE_ALIASES)
+        choice = _resolve_site(target)
         if not choice:
             # if user said open google <query>, treat as search
             if target.startswith("google "):
@@ -280,7 +468,7 @@ class Executor:
         speaker.say(f"Opening {choice}.")
 
     def web_search(self, query: str):
-        url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        url = f"https://www.google.com/search?q={quote_plus(query)}"
         webbrowser.open(url)
         speaker.say(f"Searching for {query}.")
 
@@ -296,27 +484,24 @@ class Executor:
         speaker.say(f"It's {now}.")
 
     def volume_up(self):
-        if win32api:
-            for _ in range(10):
-                win32api.keybd_event(0xAF, 0, 0, 0)
+        tap_keys(VK_VOLUME_UP)
         speaker.say("Volume up.")
 
     def volume_down(self):
-        if win32api:
-            for _ in range(10):
-                win32api.keybd_event(0xAE, 0, 0, 0)
+        tap_keys(VK_VOLUME_DOWN)
         speaker.say("Volume down.")
 
     def mute(self):
-        if win32api:
-            win32api.keybd_event(0xAD, 0, 0, 0)
+        tap_keys(VK_VOLUME_MUTE)
         speaker.say("Muted.")
 
     def screenshot(self):
         if pyautogui:
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            p = os.path.join(os.path.expanduser("~"), f"Pictures\\Nova_Screenshot_{ts}.png")
-            os.makedirs(os.path.dirname(p), exist_ok=True)
+            if not self._pictures_ready:
+                os.makedirs(_PICTURES_DIR, exist_ok=True)
+                self._pictures_ready = True
+            p = os.path.join(_PICTURES_DIR, f"Nova_Screenshot_{ts}.png")
             img = pyautogui.screenshot()
             img.save(p)
             speaker.say("Screenshot saved in Pictures.")
@@ -325,6 +510,18 @@ class Executor:
 
 executor = Executor()
 
+_DISPATCH = {
+    "search": lambda m: executor.web_search(m["query"]),
+    "close": lambda m: executor.close_foreground(),
+    "open": lambda m: executor.open_target(m["open_target"]),
+    "launch": lambda m: executor.open_app(m["app"]),
+    "time": lambda m: executor.tell_time(),
+    "volume_up": lambda m: executor.volume_up(),
+    "volume_down": lambda m: executor.volume_down(),
+    "mute": lambda m: executor.mute(),
+    "screenshot": lambda m: executor.screenshot(),
+}
+
 # -------- Orchestrator -------- #
 class Nova:
     def __init__(self, device_idx: int | None, debug: bool, bypass_wake: bool):
@@ -340,8 +537,7 @@ class Nova:
 
     def _gate_intent(self, text: str) -> bool:
         # act only if starts with a known verb to avoid random sentences
-        first = text.split(" ")[0]
-        return first in {"open", "search", "google", "lookup", "close", "time", "what"}
+        return text.partition(" ")[0] in _GATE_VERBS
 
     def on_final(self, text: str):
         text = normalize(text)
@@ -355,8 +551,7 @@ class Nova:
 
         # Clean and map confusions, then strip wake words if present
         clean = apply_confusions(text)
-        for pat in WAKE_WORDS:
-            clean = re.sub(pat, "", clean, flags=re.IGNORECASE).strip()
+        clean = _WAKE_RE.sub("", clean).strip()
         if not clean:
             return
 
@@ -368,26 +563,8 @@ class Nova:
             return
 
         # Route intents (order matters)
-        if m := SEARCH_PAT.match(clean):
-            executor.web_search(m.group(2))
-        elif m := CLOSE_PAT.match(clean):
-            target = m.group(2)
-            # special case: "close google/chrome" just alt+f4
-            executor.close_foreground()
-        elif m := OPEN_APP_PAT.match(clean):
-            executor.open_app(m.group(2))
-        elif m := OPEN_SITE_PAT.match(clean):
-            executor.open_site(m.group(2))
-        elif TIME_PAT.match(clean):
-            executor.tell_time()
-        elif VOLUME_UP_PAT.match(clean):
-            executor.volume_up()
-        elif VOLUME_DOWN_PAT.match(clean):
-            executor.volume_down()
-        elif MUTE_PAT.match(clean):
-            executor.mute()
-        elif SCREENSHOT_PAT.match(clean):
-            executor.screenshot()
+        if m := _INTENT_RE.match(clean):
+            _DISPATCH[m.lastgroup](m)
         else:
             # fallback: if contains the word google <query>
             if clean.startswith("google "):
@@ -15,21 +15,25 @@ Run examples:
     python mainv3_whisper.py --device 1 --model small --compute int8 --debug
 
 Notes:
-- If you have a GPU (NVIDIA), try: --compute float16 (needs CUDA); CPU: use int8/int8_float16
-- We chunk the mic every ~1.5s and run Whisper with vad_filter=True to ignore silence/noise.
+- --compute defaults to int8_float16 when a CUDA device is found, int8 otherwise.
+- The mic is cut into utterances at ~360 ms of trailing silence (max 5 s) and each one is run
+  through Whisper with vad_filter=True.
 """
 
 import os
 import re
 import json
-import time
 import queue
 import threading
 import subprocess
 import webbrowser
 import argparse
+import ctypes
 from datetime import datetime
 from difflib import get_close_matches
+from collections import deque
+from functools import lru_cache
+from urllib.parse import quote_plus
 
 import numpy as np
 import sounddevice as sd
@@ -38,19 +42,54 @@ from faster_whisper import WhisperModel
 
 try:
     import win32api
+    import pythoncom
 except Exception:
-    win32api = None
+    win32api = pythoncom = None
+
+try:
+    _user32 = ctypes.windll.user32  # SendInput: a whole key burst in one call
+except Exception:
+    _user32 = None
 
 try:
     import pyautogui
 except Exception:
     pyautogui = None
 
+try:
+    from rapidfuzz import fuzz, process as fuzz_process  # pip install rapidfuzz (much faster than difflib)
+except Exception:
+    fuzz = fuzz_process = None
+
+try:
+    import ctranslate2  # installed with faster-whisper; used to detect CUDA for --compute
+except Exception:
+    ctranslate2 = None
+
+try:
+    import webrtcvad  # pip install webrtcvad: cheap speech check before running Whisper
+except Exception:
+    webrtcvad = None
+
+try:
+    import ahocorasick  # pip install pyahocorasick: confusion rewrites in one automaton pass
+except Exception:
+    ahocorasick = None
+
 
 WAKE_WORDS = [r"\bhey\s+nova\b", r"\bhello\s+nova\b", r"\bhey\s+noah\b", r"\bhey\s+novaa\b"]
 INTENT_VERBS = {"open", "search", "google", "lookup", "close", "time", "what", "volume", "mute", "screenshot"}
+_GATE_VERBS = frozenset({"open", "search", "google", "lookup", "close", "time", "what"})
+_PICTURES_DIR = os.path.join(os.path.expanduser("~"), "Pictures")
 SAMPLE_RATE = 16000
-CHUNK_SECONDS = 1.5  # adjust with your chunks per second
+INT16_SCALE = np.float32(3.0517578125e-05)  # 1 / 32768
+RING_SECONDS = 8  # audio kept in the capture ring; oldest samples are overwritten
+SILENCE_RMS = 0.005  # frames quieter than this count as silence
+VAD_FRAME_MS = 30  # webrtcvad accepts 10/20/30 ms frames
+VAD_FRAME = SAMPLE_RATE * VAD_FRAME_MS // 1000
+ENDPOINT_MS = 360  # trailing silence that ends an utterance
+MAX_UTTER_S = 5  # long monologues are cut here
+PREROLL_MS = 300  # audio kept from just before speech starts
 
 APP_PATHS = {
     "chrome": r"C:\\Program Files\\Google\\Chrome\\Application\\chrome.exe",
@@ -100,60 +139,191 @@ SITE_ALIASES = {
     "good": "github",      # your custom alias
 }
 
+# Speech reaches the resolvers already normalized (lowercase, stripped), so the keys
+# are normalized once here instead of lowering the input on every lookup
+APP_PATHS = {k.strip().lower(): v for k, v in APP_PATHS.items()}
+WEBSITES = {k.strip().lower(): v for k, v in WEBSITES.items()}
+APP_ALIASES = {k.strip().lower(): v.strip().lower() for k, v in APP_ALIASES.items()}
+SITE_ALIASES = {k.strip().lower(): v.strip().lower() for k, v in SITE_ALIASES.items()}
+
+# Fuzzy-match candidates, built once instead of per command
+APP_KEYS = tuple(APP_PATHS)
+SITE_KEYS = tuple(WEBSITES)
+APP_KEYS_SET = frozenset(APP_KEYS)
+SITE_KEYS_SET = frozenset(SITE_KEYS)
+
+# Text-cleanup regexes, compiled once at import
+_WAKE_RE = re.compile("|".join(f"(?:{p})" for p in WAKE_WORDS), re.IGNORECASE)
+_CONFUSION_MAP = {k.lower(): v for k, v in CONFUSIONS.items()}
+# longer keys first so "oh been" wins over "been"; sorted once, shared by both matchers
+_CONFUSION_KEYS_SORTED = tuple(sorted(_CONFUSION_MAP, key=len, reverse=True))
+_CONFUSION_RE = re.compile(r"\b(" + "|".join(re.escape(k) for k in _CONFUSION_KEYS_SORTED) + r")\b")
+_WS_RE = re.compile(r"\s+")
+
+# Same rewrite as _CONFUSION_RE, as an Aho-Corasick automaton: cost stays linear in the
+# transcript however many confusions get added
+if ahocorasick:
+    _CONFUSION_AC = ahocorasick.Automaton()
+    for _k in _CONFUSION_KEYS_SORTED:
+        _CONFUSION_AC.add_word(_k, (len(_k), _CONFUSION_MAP[_k]))
+    _CONFUSION_AC.make_automaton()
+else:
+    _CONFUSION_AC = None
+
 
 class Speaker:
     def __init__(self):
-        self.engine = pyttsx3.init()
-        self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
-        self.lock = threading.Lock()
+        # speech plays on a worker thread so say() never blocks listening
+        self.q: queue.Queue[str] = queue.Queue()
+        self.worker = threading.Thread(target=self._run, daemon=True)
+        self.worker.start()
+    def _run(self):
+        # the SAPI engine is a COM object: create and drive it on this thread only
+        try:
+            if pythoncom:
+                pythoncom.CoInitialize()
+            self.engine = pyttsx3.init()
+            self.engine.setProperty('rate', int(self.engine.getProperty('rate') * 0.95))
+        except Exception as e:
+            # keep draining the queue so replies still show up as text
+            print(f"[tts] speech engine failed to start, printing replies instead: {e}")
+            self.engine = None
+        while True:
+            text = self.q.get()
+            if self.engine is None:
+                print(f"[tts] {text}")
+                continue
+            try:
+                self.engine.say(text)
+                self.engine.runAndWait()
+            except Exception as e:
+                print(f"[tts] couldn't speak {text!r}: {e}")
     def say(self, text: str):
-        with self.lock:
-            self.engine.say(text)
-            self.engine.runAndWait()
+        self.q.put(text)
 
 speaker = Speaker()
 
 
 def fuzzy_wake(text: str) -> bool:
-    t = text.lower()
-    return any(re.search(p, t) for p in WAKE_WORDS)
+    return _WAKE_RE.search(text) is not None
 
 def normalize(t: str) -> str:
     t = t.lower().strip()
-    t = re.sub(r"\s+", " ", t)
+    t = _WS_RE.sub(" ", t)
     return t
 
-def apply_confusions(t: str) -> str:
-    keys = sorted(CONFUSIONS.keys(), key=len, reverse=True)
-    for k in keys:
-        t = re.sub(rf"\b{re.escape(k)}\b", CONFUSIONS[k], t)
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+def _word_boundary(t: str, i: int) -> bool:
+    # same test as regex \b between t[i-1] and t[i]
+    left = i > 0 and (t[i - 1].isalnum() or t[i - 1] == "_")
+    right = i < len(t) and (t[i].isalnum() or t[i] == "_")
+    return left != right
+
+def _replace_confusions_ac(t: str) -> str:
+    # keep leftmost-longest, non-overlapping, whole-word hits (what the regex alternation does)
+    hits = []
+    for end, (size, repl) in _CONFUSION_AC.iter(t):
+        start = end - size + 1
+        if _word_boundary(t, start) and _word_boundary(t, end + 1):
+            hits.append((start, end + 1, repl))
+    hits.sort(key=lambda h: (h[0], -h[1]))
+    out, pos = [], 0
+    for start, stop, repl in hits:
+        if start < pos:
+            continue
+        out.append(t[pos:start])
+        out.append(repl)
+        pos = stop
+    out.append(t[pos:])
+    return "".join(out)
 
-def resolve_name_fuzzy(name: str, choices: list[str], extra_alias: dict[str, str] | None = None) -> str | None:
-    n = name.strip().lower()
-    if extra_alias and n in extra_alias:
-        n = extra_alias[n]
-    if n in choices:
+def apply_confusions(t: str) -> str:
+    # single left-to-right pass over the text, whatever the number of confusions
+    if _CONFUSION_AC:
+        t = _replace_confusions_ac(t)
+    else:
+        t = _CONFUSION_RE.sub(lambda m: _CONFUSION_MAP[m.group(1)], t)
+    return _WS_RE.sub(" ", t).strip()
+
+def resolve_name_fuzzy(name: str, choices: tuple[str, ...], choices_set: frozenset[str],
+                       extra_alias: dict[str, str] | None = None) -> str | None:
+    # name comes from normalize()d speech: already lowercase and stripped
+    n = extra_alias.get(name, name) if extra_alias else name
+    # exact key: O(1) hash hit, skip the fuzzy scan
+    if n in choices_set:
         return n
+    if fuzz_process:
+        best = fuzz_process.extractOne(n, choices, scorer=fuzz.WRatio, score_cutoff=70)
+        return best[0] if best else None
     matches = get_close_matches(n, choices, n=1, cutoff=0.7)
     return matches[0] if matches else None
 
+# Same few names are spoken again and again; the alias/choice maps never change at runtime
+@lru_cache(maxsize=512)
+def _resolve_app(name: str) -> str | None:
+    return resolve_name_fuzzy(name, APP_KEYS, APP_KEYS_SET, APP_ALIASES)
+
+@lru_cache(maxsize=512)
+def _resolve_site(name: str) -> str | None:
+    return resolve_name_fuzzy(name, SITE_KEYS, SITE_KEYS_SET, SITE_ALIASES)
+
+def default_compute_type() -> str:
+    # int8_float16 is the fastest ctranslate2 type on CUDA; int8 on CPU
+    try:
+        if ctranslate2 and ctranslate2.get_cuda_device_count() > 0:
+            return "int8_float16"
+    except Exception:
+        pass
+    return "int8"
+
 class WhisperListener:
-    def __init__(self, device_idx: int | None, model_size: str, compute_type: str, debug: bool):
+    def __init__(self, device_idx: int | None, model_size: str, compute_type: str | None, debug: bool):
         self.device_idx = device_idx
         self.debug = debug
-        self.model = WhisperModel(model_size, device="auto", compute_type=compute_type)
+        compute_type = compute_type or default_compute_type()
+        self.model = WhisperModel(model_size, device="auto", compute_type=compute_type, cpu_threads=os.cpu_count() or 0)
         self.stream = None
-        self.buffer = np.zeros(0, dtype=np.float32)
+        # fixed ring filled by the audio callback; no per-callback allocation
+        self.ring = np.empty(SAMPLE_RATE * RING_SECONDS, dtype=np.float32)
+        self.write = 0
+        self.available = 0
         self.lock = threading.Lock()
         self.stop_flag = threading.Event()
-        self.frames_per_chunk = int(SAMPLE_RATE * CHUNK_SECONDS)
+        self.utter = np.empty(SAMPLE_RATE * MAX_UTTER_S, dtype=np.float32)
+        # capture -> utterances in chunk_q -> transcribe worker -> text_q -> listen_loop
+        self.chunk_q = queue.Queue(maxsize=2)
+        self.text_q = queue.Queue()
+        self.workers = []
+        self.vad = webrtcvad.Vad(2) if webrtcvad else None
+        # one silent second through the model so lazy allocations happen before the first command
+        warmup = np.zeros(SAMPLE_RATE, dtype=np.float32)
+        list(self.model.transcribe(warmup, language="en", beam_size=1)[0])
+        # and once with _transcribe's VAD options so the Silero VAD model is loaded now too
+        # (the VAD finds no speech in silence, which is why the call above runs without it)
+        list(self.model.transcribe(
+            warmup,
+            language="en",
+            vad_filter=True,
+            vad_parameters=dict(min_silence_duration_ms=300),
+            beam_size=1,
+        )[0])
+        if self.debug:
+            print(f"[whisper] {model_size} ready ({compute_type})")
 
     def _callback(self, indata, frames, time_info, status):
-        pcm = np.frombuffer(bytes(indata), dtype=np.int16).astype(np.float32) / 32768.0
+        # int16 -> float32 in one ufunc pass, written straight into the ring (no temporaries)
+        pcm = np.frombuffer(indata, dtype=np.int16)
+        size = self.ring.shape[0]
+        n = pcm.shape[0]
+        if n > size:
+            pcm = pcm[-size:]
+            n = size
         with self.lock:
-            self.buffer = np.concatenate([self.buffer, pcm])
+            w = self.write
+            first = min(n, size - w)
+            np.multiply(pcm[:first], INT16_SCALE, out=self.ring[w : w + first])
+            np.multiply(pcm[first:], INT16_SCALE, out=self.ring[: n - first])
+            self.write = (w + n) % size
+            self.available = min(self.available + n, size)
 
     def start(self):
         self.stop_flag.clear()
@@ -166,6 +336,12 @@ class WhisperListener:
             callback=self._callback,
         )
         self.stream.start()
+        self.workers = [
+            threading.Thread(target=self._produce, daemon=True),
+            threading.Thread(target=self._transcribe, daemon=True),
+        ]
+        for t in self.workers:
+            t.start()
         if self.debug:
             print(f"[audio] using Whisper @ {SAMPLE_RATE} Hz, device {self.device_idx}")
 
@@ -175,22 +351,83 @@ class WhisperListener:
             self.stream.stop()
             self.stream.close()
             self.stream = None
+        for t in self.workers:
+            t.join(timeout=2)
+        self.workers = []
 
-    def listen_loop(self, on_text):
+    def _read(self, n: int):
+        # copy the oldest n samples out of the ring (two slices on wrap)
+        size = self.ring.shape[0]
+        with self.lock:
+            if self.available < n:
+                return None
+            out = np.empty(n, dtype=np.float32)
+            r = (self.write - self.available) % size
+            first = min(n, size - r)
+            out[:first] = self.ring[r : r + first]
+            out[first:] = self.ring[: n - first]
+            self.available -= n
+        return out
+
+    def _voiced(self, frame) -> bool:
+        # energy gate first, then webrtcvad on the 30 ms frame
+        if float(np.sqrt(np.mean(frame * frame))) < SILENCE_RMS:
+            return False
+        if self.vad is None:
+            return True
+        return self.vad.is_speech((frame * 32767.0).astype(np.int16).tobytes(), SAMPLE_RATE)
+
+    def _emit(self, n: int):
+        # hand an utterance to the transcriber; drop the oldest if inference lags
+        utter = self.utter[:n].copy()
         try:
-            while not self.stop_flag.is_set():
-                time.sleep(0.2)
-                with self.lock:
-                    if self.buffer.shape[0] >= self.frames_per_chunk:
-                        chunk = self.buffer[: self.frames_per_chunk]
-                        self.buffer = self.buffer[self.frames_per_chunk :]
-                    else:
-                        chunk = None
-                if chunk is None:
+            self.chunk_q.put_nowait(utter)
+        except queue.Full:
+            try:
+                self.chunk_q.get_nowait()
+            except queue.Empty:
+                pass
+            self.chunk_q.put_nowait(utter)
+
+    def _produce(self):
+        # VAD endpointing: an utterance starts on a voiced frame (plus pre-roll) and ends
+        # after ENDPOINT_MS of silence or when MAX_UTTER_S is reached
+        endpoint = ENDPOINT_MS // VAD_FRAME_MS
+        limit = self.utter.shape[0]
+        preroll = deque(maxlen=PREROLL_MS // VAD_FRAME_MS)
+        n = 0  # samples in the current utterance; 0 while idle
+        silent = 0
+        while not self.stop_flag.is_set():
+            frame = self._read(VAD_FRAME)
+            if frame is None:
+                self.stop_flag.wait(VAD_FRAME_MS / 1000)
+                continue
+            voiced = self._voiced(frame)
+            if not n:
+                if not voiced:
+                    preroll.append(frame)
                     continue
-                # Transcribe this chunk
+                for f in preroll:
+                    self.utter[n : n + VAD_FRAME] = f
+                    n += VAD_FRAME
+                preroll.clear()
+            self.utter[n : n + VAD_FRAME] = frame
+            n += VAD_FRAME
+            silent = 0 if voiced else silent + 1
+            if silent >= endpoint or n + VAD_FRAME > limit:
+                self._emit(n)
+                n = silent = 0
+
+    def _transcribe(self):
+        while not self.stop_flag.is_set():
+            try:
+                utter = self.chunk_q.get(timeout=0.2)
+            except queue.Empty:
+                continue
+            # one failed inference must not kill the worker (listen_loop would wait on text_q forever)
+            try:
                 segments, info = self.model.transcribe(
-                    chunk,
+                    utter,
                     language="en",
                     vad_filter=True,
                     vad_parameters=dict(min_silence_duration_ms=300),
@@ -198,29 +435,102 @@ class WhisperListener:
                     condition_on_previous_text=False,
                 )
                 text = "".join(seg.text for seg in segments).strip()
-                if text:
-                    if self.debug:
-                        print("final:", text)
-                    on_text(text)
+            except Exception as e:
+                print(f"[whisper] transcription failed: {e}")
+                continue
+            if text:
+                self.text_q.put(text)
+
+    def listen_loop(self, on_text):
+        try:
+            while not self.stop_flag.is_set():
+                try:
+                    text = self.text_q.get(timeout=0.2)
+                except queue.Empty:
+                    continue
+                if self.debug:
+                    print("final:", text)
+                on_text(text)
         except KeyboardInterrupt:
             return
 
+# Key input
+KEYEVENTF_KEYUP = 0x0002
+INPUT_KEYBOARD = 1
+VK_VOLUME_MUTE, VK_VOLUME_DOWN, VK_VOLUME_UP = 0xAD, 0xAE, 0xAF
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", ctypes.c_ushort), ("wScan", ctypes.c_ushort), ("dwFlags", ctypes.c_ulong),
+                ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class MOUSEINPUT(ctypes.Structure):
+    # only here so the INPUT union has its real size
+    _fields_ = [("dx", ctypes.c_long), ("dy", ctypes.c_long), ("mouseData", ctypes.c_ulong),
+                ("dwFlags", ctypes.c_ulong), ("time", ctypes.c_ulong), ("dwExtraInfo", ctypes.c_size_t)]
+
+class _INPUTUNION(ctypes.Union):
+    _fields_ = [("mi", MOUSEINPUT), ("ki", KEYBDINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", ctypes.c_ulong), ("u", _INPUTUNION)]
+
+def _key_taps(vk: int, count: int):
+    # count down+up pairs in one INPUT array
+    arr = (INPUT * (count * 2))()
+    for i, ev in enumerate(arr):
+        ev.type = INPUT_KEYBOARD
+        ev.u.ki.wVk = vk
+        ev.u.ki.dwFlags = KEYEVENTF_KEYUP if i % 2 else 0
+    return arr
+
+# built once; each command replays its array with a single SendInput call
+_KEY_TAPS = {
+    VK_VOLUME_UP: _key_taps(VK_VOLUME_UP, 10),
+    VK_VOLUME_DOWN: _key_taps(VK_VOLUME_DOWN, 10),
+    VK_VOLUME_MUTE: _key_taps(VK_VOLUME_MUTE, 1),
+}
+
+def tap_keys(vk: int) -> bool:
+    taps = _KEY_TAPS[vk]
+    if _user32:
+        _user32.SendInput(len(taps), taps, ctypes.sizeof(INPUT))
+        return True
+    if win32api:
+        for _ in range(len(taps) // 2):
+            win32api.keybd_event(vk, 0, 0, 0)
+            win32api.keybd_event(vk, 0, KEYEVENTF_KEYUP, 0)
+        return True
+    return False
+
 # Intent parsing 
-OPEN_APP_PAT   = re.compile(r"^(open|launch|start)\s+(.+)$")
-OPEN_SITE_PAT  = re.compile(r"^(open)\s+(.+)$")
-SEARCH_PAT     = re.compile(r"^(search for|google|lookup)\s+(.+)$")
-CLOSE_PAT      = re.compile(r"^(close)\s+(.+)$")
-TIME_PAT       = re.compile(r"^(what\s+time\s+is\s+it|time)$")
-VOLUME_UP_PAT  = re.compile(r"^(volume up|increase volume)$")
-VOLUME_DOWN_PAT= re.compile(r"^(volume down|decrease volume)$")
-MUTE_PAT       = re.compile(r"^(mute|mute volume)$")
-SCREENSHOT_PAT = re.compile(r"^(take a screenshot|screenshot)$")
+# All intents in one anchored alternation: a single match per command, and the
+# outer named group that matched (m.lastgroup) picks the handler in _DISPATCH
+_INTENT_RE = re.compile(
+    r"^(?:"
+    r"(?P<search>(?:search for|google|lookup)\s+(?P<query>.+))"
+    r"|(?P<close>close\s+(?P<close_target>.+))"
+    r"|(?P<open>open\s+(?P<open_target>.+))"
+    r"|(?P<launch>(?:launch|start)\s+(?P<app>.+))"
+    r"|(?P<time>what\s+time\s+is\s+it|time)"
+    r"|(?P<volume_up>volume up|increase volume)"
+    r"|(?P<volume_down>volume down|decrease volume)"
+    r"|(?P<mute>mute|mute volume)"
+    r"|(?P<screenshot>take a screenshot|screenshot)"
+    r")$"
+)
+
+def app_name(phrase: str) -> str:
+    # "chrome for me" / "spotify on speakers" -> the app part only
+    return phrase.split(" for ")[0].split(" on ")[0].strip()
 
 class Executor:
+    def __init__(self):
+        # Pictures dir is created on the first screenshot only
+        self._pictures_ready = False
+
     def open_app(self, phrase: str):
-        target = phrase.split(" for ")[0].split(" on ")[0].strip()
-        key = APP_ALIASES.get(target, target)
-        choice = resolve_name_fuzzy(key, list(APP_PATHS.keys()), APP_ALIASES)
+        target = app_name(phrase)
+        choice = _resolve_app(target)
         if not choice:
             speaker.say(f"I couldn't find an app like {target}.")
             return
@@ -230,9 +540,18 @@ class Executor:
         except Exception:
             speaker.say(f"Couldn't open {choice}.")
 
+    def open_target(self, phrase: str):
+        # "open X": a known site (exact/alias) first, then an app, then a fuzzy site match
+        target = phrase.strip()
+        if SITE_ALIASES.get(target, target) in SITE_KEYS_SET:
+            return self.open_site(target)
+        if _resolve_app(app_name(target)):
+            return self.open_app(target)
+        return self.open_site(target)
+
     def open_site(self, phrase: str):
         target = SITE_ALIASES.get(phrase.strip(), phrase.strip())
-        choice = resolve_name_fuzzy(target, list(WEBSITES.keys()), SITE_ALIASES)
+        choice = _resolve_site(target)
         if not choice:
             if target.startswith("google "):
                 q = target[len("google "):]
@@ -243,7 +562,7 @@ class Executor:
         speaker.say(f"Opening {choice}.")
 
     def web_search(self, query: str):
-        url = f"https://www.google.com/search?q={query.replace(' ', '+')}"
+        url = f"https://www.google.com/search?q={quote_plus(query)}"
         webbrowser.open(url)
         speaker.say(f"Searching for {query}.")
 
@@ -259,27 +578,24 @@ class Executor:
         speaker.say(f"It's {now}.")
 
     def volume_up(self):
-        if win32api:
-            for _ in range(10):
-                win32api.keybd_event(0xAF, 0, 0, 0)
+        tap_keys(VK_VOLUME_UP)
         speaker.say("Volume up.")
 
     def volume_down(self):
-        if win32api:
-            for _ in range(10):
-                win32api.keybd_event(0xAE, 0, 0, 0)
+        tap_keys(VK_VOLUME_DOWN)
         speaker.say("Volume down.")
 
     def mute(self):
-        if win32api:
-            win32api.keybd_event(0xAD, 0, 0, 0)
+        tap_keys(VK_VOLUME_MUTE)
         speaker.say("Muted.")
 
     def screenshot(self):
         if pyautogui:
             ts = datetime.now().strftime("%Y%m%d_%H%M%S")
-            p = os.path.join(os.path.expanduser("~"), f"Pictures\\Nova_Screenshot_{ts}.png")
-            os.makedirs(os.path.dirname(p), exist_ok=True)
+            if not self._pictures_ready:
+                os.makedirs(_PICTURES_DIR, exist_ok=True)
+                self._pictures_ready = True
+            p = os.path.join(_PICTURES_DIR, f"Nova_Screenshot_{ts}.png")
             img = pyautogui.screenshot()
             img.save(p)
             speaker.say("Screenshot saved in Pictures.")
@@ -288,17 +604,28 @@ class Executor:
 
 executor = Executor()
 
+_DISPATCH = {
+    "search": lambda m: executor.web_search(m["query"]),
+    "close": lambda m: executor.close_foreground(),
+    "open": lambda m: executor.open_target(m["open_target"]),
+    "launch": lambda m: executor.open_app(m["app"]),
+    "time": lambda m: executor.tell_time(),
+    "volume_up": lambda m: executor.volume_up(),
+    "volume_down": lambda m: executor.volume_down(),
+    "mute": lambda m: executor.mute(),
+    "screenshot": lambda m: executor.screenshot(),
+}
+
 # Orchestrator 
 class Nova:
-    def __init__(self, device_idx: int | None, model_size: str, compute_type: str, debug: bool, bypass_wake: bool):
+    def __init__(self, device_idx: int | None, model_size: str, compute_type: str | None, debug: bool, bypass_wake: bool):
         self.listener = WhisperListener(device_idx, model_size, compute_type, debug)
         self.awake = bypass_wake
         self.debug = debug
         self.bypass_wake = bypass_wake
 
     def _gate_intent(self, text: str) -> bool:
-        first = text.split(" ")[0]
-        return first in {"open", "search", "google", "lookup", "close", "time", "what"}
+        return text.partition(" ")[0] in _GATE_VERBS
 
     def on_text(self, text: str):
         raw = normalize(text)
@@ -311,8 +638,7 @@ class Nova:
             return
 
         clean = apply_confusions(raw)
-        for pat in WAKE_WORDS:
-            clean = re.sub(pat, "", clean, flags=re.IGNORECASE).strip()
+        clean = _WAKE_RE.sub("", clean).strip()
         if not clean:
             return
         if self.debug:
@@ -321,24 +647,8 @@ class Nova:
             return
 
         # Route intents
-        if m := SEARCH_PAT.match(clean):
-            executor.web_search(m.group(2))
-        elif m := CLOSE_PAT.match(clean):
-            executor.close_foreground()
-        elif m := OPEN_APP_PAT.match(clean):
-            executor.open_app(m.group(2))
-        elif m := OPEN_SITE_PAT.match(clean):
-            executor.open_site(m.group(2))
-        elif TIME_PAT.match(clean):
-            executor.tell_time()
-        elif VOLUME_UP_PAT.match(clean):
-            executor.volume_up()
-        elif VOLUME_DOWN_PAT.match(clean):
-            executor.volume_down()
-        elif MUTE_PAT.match(clean):
-            executor.mute()
-        elif SCREENSHOT_PAT.match(clean):
-            executor.screenshot()
+        if m := _INTENT_RE.match(clean):
+            _DISPATCH[m.lastgroup](m)
         else:
             if clean.startswith("google "):
                 executor.web_search(clean[len("google "):])
@@ -360,7 +670,7 @@ def main():
     parser.add_argument("--list-devices", action="store_true", help="List audio devices and exit")
     parser.add_argument("--device", type=int, default=None, help="Input device index to use")
     parser.add_argument("--model", type=str, default="small", help="Whisper model size: tiny/base/small/medium/large-v3")
-    parser.add_argument("--compute", type=str, default="int8", help="Compute type: int8/int8_float16/float16/float32")
+    parser.add_argument("--compute", type=str, default=None, help="Compute type: int8/int8_float16/float16/float32 (default: int8_float16 on CUDA, else int8)")
     parser.add_argument("--debug", action="store_true", help="Verbose logs")
     parser.add_argument("--bypass-wake", action="store_true", help="Start already awake (testing)")
     args = parser.parse_args()